@@ -1,6 +1,5 @@
 import json
 import logging
-import multiprocessing
 import os
 from argparse import Namespace
 from contextlib import closing
@@ -103,9 +102,11 @@ def convert_examples_to_features(
     max_query_length,
     segment_b_id,
     add_extra_sep_token,
-    pool_size=multiprocessing.cpu_count(),
+    pool_size=None,
     chunk_size=30,
 ):
+    pool_size = pool_size or os.cpu_count() or 1
+
     worker_params = Namespace(
         tokenizer=tokenizer,
         max_seq_length=max_seq_length,
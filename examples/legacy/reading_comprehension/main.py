@@ -1,6 +1,5 @@
 import json
 import logging
-import multiprocessing
 import os
 from argparse import Namespace
 
@@ -36,7 +35,7 @@ def cli():
 @click.argument("dump_db_file", type=click.Path(exists=True))
 @click.argument("mention_db_file", type=click.Path(exists=True))
 @click.argument("out_file", type=click.Path())
-@click.option("--pool-size", default=multiprocessing.cpu_count())
+@click.option("--pool-size", type=int, default=os.cpu_count)
 @click.option("--chunk-size", default=100)
 @click.pass_obj
 def build_wiki_link_db(common_args, dump_db_file, mention_db_file, **kwargs):
@@ -1,5 +1,5 @@
 import logging
-import multiprocessing
+import os
 import unicodedata
 from argparse import Namespace
 from contextlib import closing
@@ -65,9 +65,11 @@ def convert_examples_to_features(
     segment_b_id,
     add_extra_sep_token,
     is_training,
-    pool_size=multiprocessing.cpu_count(),
+    pool_size=None,
     chunk_size=30,
 ):
+    pool_size = pool_size or os.cpu_count() or 1
+
     passage_encoder = PassageEncoder(
         tokenizer,
         entity_vocab,
@@ -1,11 +1,11 @@
 import logging
-from contextlib import closing
-from multiprocessing.pool import Pool
 
 import joblib
 import marisa_trie
 from tqdm import tqdm
 
+from luke.utils.parallel import map_chunks
+
 logger = logging.getLogger(__name__)
 
 
@@ -56,12 +56,17 @@ class WikiLinkDB(object):
 
         with tqdm(total=dump_db.page_size(), mininterval=0.5) as pbar:
             initargs = (dump_db, mention_db, title_trie)
-            with closing(Pool(pool_size, initializer=WikiLinkDB._initialize_worker, initargs=initargs)) as pool:
-                for title, links in pool.imap_unordered(
-                    WikiLinkDB._extract_wiki_links, title_trie, chunksize=chunk_size
-                ):
-                    data[title] = links
-                    pbar.update()
+            for title, links in map_chunks(
+                WikiLinkDB._extract_wiki_links,
+                title_trie,
+                pool_size,
+                chunk_size,
+                initializer=WikiLinkDB._initialize_worker,
+                initargs=initargs,
+                ordered=False,
+            ):
+                data[title] = links
+                pbar.update()
 
         mention_trie = marisa_trie.Trie(text for links in data.values() for text, _, _ in links)
 
@@ -1,23 +1,24 @@
 import click
-import functools
 
 
 def commet_logger_args(func):
-    @functools.wraps(func)
-    @click.option("--comet-project-name")
-    @click.option("--comet-offline", is_flag=True)
-    @click.option("--comet-offline-dir", type=click.Path(exists=True), default=".")
-    @click.option("--comet-auto-metric-logging", is_flag=True)
-    @click.option("--comet-auto-output-logging", is_flag=True)
-    @click.option("--comet-log-code", is_flag=True)
-    @click.option("--comet-log-env-cpu", is_flag=True)
-    @click.option("--comet-log-env-gpu", is_flag=True)
-    @click.option("--comet-log-env-host", is_flag=True)
-    @click.option("--comet-log-graph", is_flag=True)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
+    for option in reversed(
+        [
+            click.option("--comet-project-name"),
+            click.option("--comet-offline", is_flag=True),
+            click.option("--comet-offline-dir", type=click.Path(exists=True), default="."),
+            click.option("--comet-auto-metric-logging", is_flag=True),
+            click.option("--comet-auto-output-logging", is_flag=True),
+            click.option("--comet-log-code", is_flag=True),
+            click.option("--comet-log-env-cpu", is_flag=True),
+            click.option("--comet-log-env-gpu", is_flag=True),
+            click.option("--comet-log-env-host", is_flag=True),
+            click.option("--comet-log-graph", is_flag=True),
+        ]
+    ):
+        func = option(func)
 
-    return wrapper
+    return func
 
 
 class NullLogger:
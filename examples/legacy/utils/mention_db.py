@@ -1,8 +1,6 @@
 import logging
 from collections import defaultdict, Counter
-from contextlib import closing
-import multiprocessing
-from multiprocessing.pool import Pool
+import os
 import click
 import joblib
 import marisa_trie
@@ -10,6 +8,8 @@ from tqdm import tqdm
 from transformers import BasicTokenizer
 from wikipedia2vec.dump_db import DumpDB
 
+from luke.utils.parallel import map_chunks, resolve_pool_and_chunk_size
+
 SEP_CHAR = "\u2581"
 REP_CHAR = "_"
 
@@ -28,8 +28,8 @@ def cli():
 @click.option("--max-candidate-size", default=100)
 @click.option("--min-link-count", default=1)
 @click.option("--max-mention-length", default=20)
-@click.option("--pool-size", default=multiprocessing.cpu_count())
-@click.option("--chunk-size", default=100)
+@click.option("--pool-size", type=int, default=os.cpu_count)
+@click.option("--chunk-size", default=None, type=int)
 def build_from_wikipedia(dump_db_file, **kwargs):
     dump_db = DumpDB(dump_db_file)
     tokenizer = BasicTokenizer(do_lower_case=False)
@@ -157,30 +157,42 @@ class MentionDB(object):
         pool_size,
         chunk_size,
     ):
+        pool_size, chunk_size = resolve_pool_and_chunk_size(dump_db.page_size(), pool_size, chunk_size)
+
         logger.info("Iteration 1/2: Extracting all entity names...")
 
         name_dict = defaultdict(Counter)
         with tqdm(total=dump_db.page_size(), mininterval=0.5) as pbar:
             initargs = (dump_db, tokenizer, normalizer, max_mention_length)
-            with closing(Pool(pool_size, initializer=MentionDB._initialize_worker, initargs=initargs)) as pool:
-                for ret in pool.imap_unordered(
-                    MentionDB._extract_name_entity_pairs, dump_db.titles(), chunksize=chunk_size
-                ):
-                    for (name, title) in ret:
-                        name_dict[name][title] += 1
-                    pbar.update()
+            for ret in map_chunks(
+                MentionDB._extract_name_entity_pairs,
+                dump_db.titles(),
+                pool_size,
+                chunk_size,
+                initializer=MentionDB._initialize_worker,
+                initargs=initargs,
+                ordered=False,
+            ):
+                for (name, title) in ret:
+                    name_dict[name][title] += 1
+                pbar.update()
 
         logger.info("Iteration 2/2: Counting occurrences of entity names...")
 
         with tqdm(total=dump_db.page_size(), mininterval=0.5) as pbar:
             name_doc_counter = Counter()
             initargs = (dump_db, tokenizer, normalizer, max_mention_length, marisa_trie.Trie(name_dict.keys()))
-            with closing(Pool(pool_size, initializer=MentionDB._initialize_worker, initargs=initargs)) as pool:
-                for names in pool.imap_unordered(
-                    MentionDB._extract_name_occurrences, dump_db.titles(), chunksize=chunk_size
-                ):
-                    name_doc_counter.update(names)
-                    pbar.update()
+            for names in map_chunks(
+                MentionDB._extract_name_occurrences,
+                dump_db.titles(),
+                pool_size,
+                chunk_size,
+                initializer=MentionDB._initialize_worker,
+                initargs=initargs,
+                ordered=False,
+            ):
+                name_doc_counter.update(names)
+                pbar.update()
 
         logger.info("Building DB...")
 
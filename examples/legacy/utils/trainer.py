@@ -1,5 +1,4 @@
 import contextlib
-import functools
 import logging
 import os
 
@@ -12,26 +11,30 @@ logger = logging.getLogger(__name__)
 
 
 def trainer_args(func):
-    @click.option("--learning-rate", default=1e-5)
-    @click.option("--lr-schedule", default="warmup_linear", type=click.Choice(["warmup_linear", "warmup_constant"]))
-    @click.option("--weight-decay", default=0.01)
-    @click.option("--max-grad-norm", default=0.0)
-    @click.option("--adam-b1", default=0.9)
-    @click.option("--adam-b2", default=0.98)
-    @click.option("--adam-eps", default=1e-6)
-    @click.option("--adam-correct-bias", is_flag=True)
-    @click.option("--warmup-proportion", default=0.06)
-    @click.option("--gradient-accumulation-steps", default=1)
-    @click.option("--fp16", is_flag=True)
-    @click.option("--fp16-opt-level", default="O2")
-    @click.option("--fp16-min-loss-scale", default=1)
-    @click.option("--fp16-max-loss-scale", default=4)
-    @click.option("--save-steps", default=0)
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-
-    return wrapper
+    for option in reversed(
+        [
+            click.option("--learning-rate", default=1e-5),
+            click.option(
+                "--lr-schedule", default="warmup_linear", type=click.Choice(["warmup_linear", "warmup_constant"])
+            ),
+            click.option("--weight-decay", default=0.01),
+            click.option("--max-grad-norm", default=0.0),
+            click.option("--adam-b1", default=0.9),
+            click.option("--adam-b2", default=0.98),
+            click.option("--adam-eps", default=1e-6),
+            click.option("--adam-correct-bias", is_flag=True),
+            click.option("--warmup-proportion", default=0.06),
+            click.option("--gradient-accumulation-steps", default=1),
+            click.option("--fp16", is_flag=True),
+            click.option("--fp16-opt-level", default="O2"),
+            click.option("--fp16-min-loss-scale", default=1),
+            click.option("--fp16-max-loss-scale", default=4),
+            click.option("--save-steps", default=0),
+        ]
+    ):
+        func = option(func)
+
+    return func
 
 
 class Trainer(object):
@@ -1,8 +1,6 @@
 import logging
-import multiprocessing
+import os
 from collections import Counter, defaultdict
-from contextlib import closing
-from multiprocessing.pool import Pool
 
 import click
 import joblib
@@ -10,6 +8,8 @@ import marisa_trie
 from tqdm import tqdm
 from wikipedia2vec.dump_db import DumpDB
 
+from luke.utils.parallel import map_chunks, resolve_pool_and_chunk_size
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,8 +23,8 @@ def cli():
 @click.argument("out_file", type=click.Path())
 @click.option("--max-candidate-size", default=100)
 @click.option("--min-mention-count", default=1)
-@click.option("--pool-size", default=multiprocessing.cpu_count())
-@click.option("--chunk-size", default=100)
+@click.option("--pool-size", type=int, default=os.cpu_count)
+@click.option("--chunk-size", default=None, type=int)
 def build_from_wikipedia(dump_db_file, **kwargs):
     dump_db = DumpDB(dump_db_file)
     EntityDB.build_from_wikipedia(dump_db, **kwargs)
@@ -61,17 +61,24 @@ class EntityDB(object):
     def build_from_wikipedia(
         dump_db: DumpDB, out_file, max_candidate_size, min_mention_count, pool_size, chunk_size,
     ):
+        pool_size, chunk_size = resolve_pool_and_chunk_size(dump_db.page_size(), pool_size, chunk_size)
+
         logger.info("Extracting all entity names...")
 
         title_dict = defaultdict(Counter)
         with tqdm(total=dump_db.page_size(), mininterval=0.5) as pbar:
-            with closing(Pool(pool_size, initializer=EntityDB._initialize_worker, initargs=(dump_db,))) as pool:
-                for ret in pool.imap_unordered(
-                    EntityDB._extract_name_entity_pairs, dump_db.titles(), chunksize=chunk_size
-                ):
-                    for (name, title) in ret:
-                        title_dict[title][name] += 1
-                    pbar.update()
+            for ret in map_chunks(
+                EntityDB._extract_name_entity_pairs,
+                dump_db.titles(),
+                pool_size,
+                chunk_size,
+                initializer=EntityDB._initialize_worker,
+                initargs=(dump_db,),
+                ordered=False,
+            ):
+                for (name, title) in ret:
+                    title_dict[title][name] += 1
+                pbar.update()
 
         logger.info("Building DB...")
 
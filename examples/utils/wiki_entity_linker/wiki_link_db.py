@@ -1,7 +1,5 @@
 import logging
-import multiprocessing
-from contextlib import closing
-from multiprocessing.pool import Pool
+import os
 
 import click
 import joblib
@@ -9,6 +7,8 @@ import marisa_trie
 from tqdm import tqdm
 from wikipedia2vec.dump_db import DumpDB
 
+from luke.utils.parallel import map_chunks, resolve_pool_and_chunk_size
+
 from .mention_db import MentionDB
 
 logger = logging.getLogger(__name__)
@@ -23,8 +23,8 @@ def cli():
 @click.argument("dump_db_file", type=click.Path(exists=True))
 @click.argument("mention_db_file", type=click.Path(exists=True))
 @click.argument("out_file", type=click.Path())
-@click.option("--pool-size", default=multiprocessing.cpu_count())
-@click.option("--chunk-size", default=100)
+@click.option("--pool-size", type=int, default=os.cpu_count)
+@click.option("--chunk-size", default=None, type=int)
 @click.pass_obj
 def build_wiki_link_db(common_args, dump_db_file, mention_db_file, **kwargs):
     dump_db = DumpDB(dump_db_file)
@@ -87,17 +87,24 @@ class WikiLinkDB(object):
 
     @staticmethod
     def build(dump_db, mention_db, out_file, pool_size, chunk_size):
+        pool_size, chunk_size = resolve_pool_and_chunk_size(dump_db.page_size(), pool_size, chunk_size)
+
         title_trie = marisa_trie.Trie(dump_db.titles())
         data = {}
 
         with tqdm(total=dump_db.page_size(), mininterval=0.5) as pbar:
             initargs = (dump_db, mention_db, title_trie)
-            with closing(Pool(pool_size, initializer=WikiLinkDB._initialize_worker, initargs=initargs)) as pool:
-                for title, links in pool.imap_unordered(
-                    WikiLinkDB._extract_wiki_links, title_trie, chunksize=chunk_size
-                ):
-                    data[title] = links
-                    pbar.update()
+            for title, links in map_chunks(
+                WikiLinkDB._extract_wiki_links,
+                title_trie,
+                pool_size,
+                chunk_size,
+                initializer=WikiLinkDB._initialize_worker,
+                initargs=initargs,
+                ordered=False,
+            ):
+                data[title] = links
+                pbar.update()
 
         mention_trie = marisa_trie.Trie(text for links in data.values() for text, _, _ in links)
 
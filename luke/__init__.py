@@ -1,2 +1,16 @@
-from .model import LukeConfig, LukeModel
-from .utils.model_utils import ModelArchive
+import importlib
+
+__all__ = ["LukeConfig", "LukeModel", "ModelArchive"]
+
+# imported on first access so that the CLI does not load torch and transformers before a subcommand is chosen
+_LAZY_ATTRIBUTES = {
+    "LukeConfig": "luke.model",
+    "LukeModel": "luke.model",
+    "ModelArchive": "luke.utils.model_utils",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,32 +1,45 @@
+import importlib
 import logging
-import multiprocessing
 import os
 import random
+import sys
+from typing import Dict, Optional
 
 import click
-import numpy as np
-import torch
-from wikipedia2vec.dump_db import DumpDB
-from wikipedia2vec.utils.wiki_dump_reader import WikiDumpReader
 
 os.environ["TF_CPP_MIN_LOG_LEVEL"] = "1"  # filter out INFO messages from Tensordflow
-try:
-    # https://github.com/tensorflow/tensorflow/issues/27023#issuecomment-501419334
-    from tensorflow.python.util import deprecation
 
-    deprecation._PRINT_DEPRECATION_WARNINGS = False
-except ImportError:
-    pass
+# subcommands are imported only when invoked to keep the startup time of the CLI short
+LAZY_COMMANDS = {
+    "build-entity-vocab": "luke.utils.entity_vocab:build_entity_vocab",
+    "build-wikipedia-pretraining-dataset": "luke.pretraining.dataset:build_wikipedia_pretraining_dataset",
+    "pretrain": "luke.pretraining.train:pretrain",
+    "compute-total-training-steps": "luke.pretraining.train:compute_total_training_steps",
+    "build-interwiki-db": "luke.utils.interwiki_db:build_interwiki_db",
+    "build-multilingual-entity-vocab": "luke.utils.entity_vocab:build_multilingual_entity_vocab",
+    "create-model-archive": "luke.utils.model_utils:create_model_archive",
+    "convert-luke-to-huggingface-model": (
+        "luke.utils.convert_luke_to_huggingface_model:convert_luke_to_huggingface_model"
+    ),
+}
 
-import luke.pretraining.dataset
-import luke.pretraining.train
-import luke.utils.entity_vocab
-import luke.utils.interwiki_db
-import luke.utils.model_utils
-import luke.utils.convert_luke_to_huggingface_model
 
+class LazyGroup(click.Group):
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
 
-@click.group()
+    def list_commands(self, ctx: click.Context):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        if cmd_name in self.lazy_commands:
+            module_name, command_name = self.lazy_commands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), command_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option("--verbose", is_flag=True)
 @click.option("--seed", type=int, default=None)
 def cli(verbose: bool, seed: int):
@@ -38,7 +51,17 @@ def cli(verbose: bool, seed: int):
         logging.basicConfig(level=logging.INFO, format=fmt)
         logging.getLogger("transformers").setLevel(level=logging.WARNING)
 
+    # the subcommand has already been imported at this point, so this does not load Tensorflow by itself
+    if "tensorflow" in sys.modules:
+        # https://github.com/tensorflow/tensorflow/issues/27023#issuecomment-501419334
+        from tensorflow.python.util import deprecation
+
+        deprecation._PRINT_DEPRECATION_WARNINGS = False
+
     if seed is not None:
+        import numpy as np
+        import torch
+
         random.seed(seed)
         np.random.seed(seed)
         torch.manual_seed(seed)
@@ -48,22 +71,15 @@ def cli(verbose: bool, seed: int):
 @cli.command()
 @click.argument("dump_file", type=click.Path(exists=True))
 @click.argument("out_file", type=click.Path())
-@click.option("--pool-size", default=multiprocessing.cpu_count())
+@click.option("--pool-size", type=int, default=os.cpu_count)
 @click.option("--chunk-size", type=int, default=100)
 def build_dump_db(dump_file: str, out_file: str, **kwargs):
+    from wikipedia2vec.dump_db import DumpDB
+    from wikipedia2vec.utils.wiki_dump_reader import WikiDumpReader
+
     dump_reader = WikiDumpReader(dump_file)
     DumpDB.build(dump_reader, out_file, **kwargs)
 
 
-cli.add_command(luke.utils.entity_vocab.build_entity_vocab)
-cli.add_command(luke.pretraining.dataset.build_wikipedia_pretraining_dataset)
-cli.add_command(luke.pretraining.train.pretrain)
-cli.add_command(luke.pretraining.train.compute_total_training_steps)
-cli.add_command(luke.utils.interwiki_db.build_interwiki_db)
-cli.add_command(luke.utils.entity_vocab.build_multilingual_entity_vocab)
-cli.add_command(luke.utils.model_utils.create_model_archive)
-cli.add_command(luke.utils.convert_luke_to_huggingface_model.convert_luke_to_huggingface_model)
-
-
 if __name__ == "__main__":
     cli()
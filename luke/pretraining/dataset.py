@@ -2,11 +2,8 @@ import functools
 import itertools
 import json
 import logging
-import multiprocessing
 import os
 import random
-from contextlib import closing
-from multiprocessing.pool import Pool
 from typing import Optional
 
 import click
@@ -25,6 +22,7 @@ from luke.utils.model_utils import (
     METADATA_FILE,
     get_entity_vocab_file_path,
 )
+from luke.utils.parallel import map_chunks, resolve_pool_and_chunk_size
 from luke.utils.sentence_splitter import SentenceSplitter
 
 logger = logging.getLogger(__name__)
@@ -50,8 +48,8 @@ _abstract_only = _language = None
 @click.option("--abstract-only", is_flag=True)
 @click.option("--include-sentences-without-entities", is_flag=True)
 @click.option("--include-unk-entities/--skip-unk-entities", default=False)
-@click.option("--pool-size", default=multiprocessing.cpu_count())
-@click.option("--chunk-size", default=100)
+@click.option("--pool-size", type=int, default=os.cpu_count)
+@click.option("--chunk-size", default=None, type=int)
 @click.option("--max-num-documents", default=None, type=int)
 @click.option("--predefined-entities-only", is_flag=True)
 def build_wikipedia_pretraining_dataset(
@@ -169,8 +167,8 @@ class WikipediaPretrainingDataset:
         abstract_only: bool,
         include_sentences_without_entities: bool,
         include_unk_entities: bool,
-        pool_size: int,
-        chunk_size: int,
+        pool_size: Optional[int],
+        chunk_size: Optional[int],
         max_num_documents: Optional[int],
         predefined_entities_only: bool,
     ):
@@ -190,6 +188,11 @@ class WikipediaPretrainingDataset:
         if max_num_documents is not None:
             target_titles = target_titles[:max_num_documents]
 
+        # the workers return serialized examples, so the chunks are capped to keep the results streaming
+        pool_size, chunk_size = resolve_pool_and_chunk_size(
+            len(target_titles), pool_size, chunk_size, max_chunk_size=100
+        )
+
         max_num_tokens = max_seq_length - 2  # 2 for [CLS] and [SEP]
 
         tokenizer.save_pretrained(output_dir)
@@ -213,16 +216,18 @@ class WikipediaPretrainingDataset:
                     include_sentences_without_entities,
                     include_unk_entities,
                 )
-                with closing(
-                    Pool(pool_size, initializer=WikipediaPretrainingDataset._initialize_worker, initargs=initargs)
-                ) as pool:
-                    for ret in pool.imap(
-                        WikipediaPretrainingDataset._process_page, target_titles, chunksize=chunk_size
-                    ):
-                        for data in ret:
-                            writer.write(data)
-                            number_of_items += 1
-                        pbar.update()
+                for ret in map_chunks(
+                    WikipediaPretrainingDataset._process_page,
+                    target_titles,
+                    pool_size,
+                    chunk_size,
+                    initializer=WikipediaPretrainingDataset._initialize_worker,
+                    initargs=initargs,
+                ):
+                    for data in ret:
+                        writer.write(data)
+                        number_of_items += 1
+                    pbar.update()
 
         with open(os.path.join(output_dir, METADATA_FILE), "w") as metadata_file:
             json.dump(
@@ -1,18 +1,18 @@
 import json
 import logging
 import math
-import multiprocessing
+import os
 from collections import Counter, OrderedDict, defaultdict, namedtuple
-from contextlib import closing
-from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import Dict, List, TextIO
+from typing import Dict, List, Optional, TextIO
 
 import click
+import ujson
 from tqdm import tqdm
 from wikipedia2vec.dump_db import DumpDB
 
 from .interwiki_db import InterwikiDB
+from .parallel import map_chunks, resolve_pool_and_chunk_size
 
 PAD_TOKEN = "[PAD]"
 UNK_TOKEN = "[UNK]"
@@ -35,8 +35,8 @@ logger = logging.getLogger(__name__)
 @click.option("--language", type=str)
 @click.option("-w", "--white-list", type=click.File(), multiple=True)
 @click.option("--white-list-only", is_flag=True)
-@click.option("--pool-size", default=multiprocessing.cpu_count())
-@click.option("--chunk-size", default=100)
+@click.option("--pool-size", type=int, default=os.cpu_count)
+@click.option("--chunk-size", default=None, type=int)
 def build_entity_vocab(dump_db_file: str, white_list: List[TextIO], language: str, **kwargs):
     dump_db = DumpDB(dump_db_file)
     white_list = [line.rstrip() for f in white_list for line in f]
@@ -110,7 +110,7 @@ class EntityVocab:
 
     def _parse_jsonl_vocab_file(self, vocab_file: str):
         with open(vocab_file, "r") as f:
-            entities_json = [json.loads(line) for line in f]
+            entities_json = [ujson.loads(line) for line in f]
 
         for item in entities_json:
             for title, language in item["entities"]:
@@ -186,16 +186,25 @@ class EntityVocab:
         min_count: int,
         white_list: List[str],
         white_list_only: bool,
-        pool_size: int,
-        chunk_size: int,
+        pool_size: Optional[int],
+        chunk_size: Optional[int],
         language: str,
     ):
+        pool_size, chunk_size = resolve_pool_and_chunk_size(dump_db.page_size(), pool_size, chunk_size)
+
         counter = Counter()
         with tqdm(total=dump_db.page_size(), mininterval=0.5) as pbar:
-            with closing(Pool(pool_size, initializer=EntityVocab._initialize_worker, initargs=(dump_db,))) as pool:
-                for ret in pool.imap_unordered(EntityVocab._count_entities, dump_db.titles(), chunksize=chunk_size):
-                    counter.update(ret)
-                    pbar.update()
+            for ret in map_chunks(
+                EntityVocab._count_entities,
+                dump_db.titles(),
+                pool_size,
+                chunk_size,
+                initializer=EntityVocab._initialize_worker,
+                initargs=(dump_db,),
+                ordered=False,
+            ):
+                counter.update(ret)
+                pbar.update()
 
         title_dict = OrderedDict()
         title_dict[PAD_TOKEN] = 0
@@ -243,8 +252,14 @@ class EntityVocab:
 @click.option("--out-file", "-o", type=click.Path())
 @click.option("--vocab-size", type=int)
 @click.option("--min-num-languages", type=int)
+@click.option("--no-mmap", is_flag=True, help="Load the inter-wiki DB into memory instead of memory-mapping it.")
 def build_multilingual_entity_vocab(
-    entity_vocab_files: List[str], inter_wiki_db_path: str, out_file: str, vocab_size: int, min_num_languages: int
+    entity_vocab_files: List[str],
+    inter_wiki_db_path: str,
+    out_file: str,
+    vocab_size: int,
+    min_num_languages: int,
+    no_mmap: bool,
 ):
 
     for entity_vocab_path in entity_vocab_files:
@@ -255,7 +270,7 @@ def build_multilingual_entity_vocab(
                 "Please use the jsonl file format and try again."
             )
 
-    db = InterwikiDB.load(inter_wiki_db_path)
+    db = InterwikiDB.load(inter_wiki_db_path, mmap_mode=None if no_mmap else "r")
 
     vocab: Dict[Entity, int] = {}  # title -> index
     inv_vocab = defaultdict(set)  # ent_id -> Set[title]
@@ -269,7 +284,7 @@ def build_multilingual_entity_vocab(
         logger.info(f"Reading {entity_vocab_path}")
         with open(entity_vocab_path, "r") as f:
             for line in tqdm(f):
-                entity_dict = json.loads(line)
+                entity_dict = ujson.loads(line)
                 for title, lang in entity_dict["entities"]:
                     entity = Entity(title, lang)
                     if title not in SPECIAL_TOKENS:
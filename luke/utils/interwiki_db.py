@@ -2,7 +2,7 @@
 import bz2
 import logging
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import click
 import joblib
@@ -112,7 +112,7 @@ class InterwikiDB:
         )
 
     @staticmethod
-    def load(in_file: str, mmap_mode="r"):
+    def load(in_file: str, mmap_mode: Optional[str] = "r"):
         data = joblib.load(in_file, mmap_mode=mmap_mode)
         title_trie = Trie()
         title_trie = title_trie.frombytes(data["title_trie"])
@@ -0,0 +1,46 @@
+import os
+from multiprocessing.pool import Pool
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+
+def map_chunks(
+    func: Callable,
+    iterable: Iterable,
+    pool_size: int,
+    chunk_size: int,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Apply `func` to each item of `iterable` in a process pool and yield the results.
+
+    The workers are forked, so large `initargs` are shared with the parent copy-on-write instead of being pickled.
+    The pool is torn down as soon as the results are consumed or the iteration is aborted.
+    """
+    pool = Pool(pool_size, initializer=initializer, initargs=initargs)
+    try:
+        map_func = pool.imap if ordered else pool.imap_unordered
+        yield from map_func(func, iterable, chunksize=chunk_size)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def resolve_pool_and_chunk_size(
+    num_items: int, pool_size: Optional[int], chunk_size: Optional[int], max_chunk_size: Optional[int] = None
+) -> Tuple[int, int]:
+    """
+    Fill in the pool size and chunk size when they are not specified.
+
+    The pool size defaults to the number of CPUs, and the chunk size gives each worker about four chunks, which keeps
+    the IPC overhead low while balancing the load at the end of the run. `max_chunk_size` bounds the derived chunk
+    size for workers returning large results.
+    """
+    pool_size = pool_size or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, num_items // (pool_size * 4))
+        if max_chunk_size is not None:
+            chunk_size = min(chunk_size, max_chunk_size)
+    return pool_size, chunk_size
@@ -1,7 +1,10 @@
+import re
 from typing import List, Tuple
 
 import pkg_resources
 
+NON_BMP_RULE = re.compile("[\U00010000-\U0010FFFF]")
+
 
 class SentenceSplitter:
     """Base class for all sentence tokenizers in this project."""
@@ -52,7 +55,7 @@ class ICUSentenceSplitter(SentenceSplitter):
 
         # replace non-BMP characters with a whitespace
         # (https://stackoverflow.com/questions/36283818/remove-characters-outside-of-the-bmp-emojis-in-python-3)
-        text = "".join(c if c <= "\uFFFF" else " " for c in text)
+        text = NON_BMP_RULE.sub(" ", text)
 
         self.breaker.setText(text)
         start_idx = 0
@@ -100,6 +103,6 @@ class OpenNLPSentenceSplitter(SentenceSplitter):
 
         # replace non-BMP characters with a whitespace
         # (https://stackoverflow.com/questions/36283818/remove-characters-outside-of-the-bmp-emojis-in-python-3)
-        text = "".join(c if c <= "\uFFFF" else " " for c in text)
+        text = NON_BMP_RULE.sub(" ", text)
 
         return [(span.getStart(), span.getEnd()) for span in self._tokenizer.sentPosDetect(text)]
@@ -1,5 +1,6 @@
 import tempfile
 
+import pytest
 from transformers import AutoTokenizer
 
 from luke.pretraining.dataset import WikipediaPretrainingDataset
@@ -9,7 +10,8 @@ from luke.utils.sentence_splitter import SentenceSplitter
 from .dummy_dump_db import DummyDumpDB
 
 
-def test_build_and_read_dataset():
+@pytest.mark.parametrize("pool_size,chunk_size", [(1, 1), (2, None)])
+def test_build_and_read_dataset(pool_size, chunk_size):
     dummy_dump_db = DummyDumpDB()
 
     tokenizer_name = "roberta-base"
@@ -36,8 +38,8 @@ def test_build_and_read_dataset():
             abstract_only=False,
             include_sentences_without_entities=True,
             include_unk_entities=True,
-            pool_size=1,
-            chunk_size=1,
+            pool_size=pool_size,
+            chunk_size=chunk_size,
             max_num_documents=None,
             predefined_entities_only=False,
         )
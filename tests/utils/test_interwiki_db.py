@@ -2,6 +2,7 @@ import bz2
 import os
 import tempfile
 
+import numpy as np
 import pytest
 
 from luke.utils.interwiki_db import InterwikiDB
@@ -26,3 +27,16 @@ def test_query(db):
     ret = dict([(v, k) for k, v in db.query("Spain", "en")])
     assert ret["ja"] == "スペイン"
     assert ret["zh"] == "西班牙"
+
+
+@pytest.mark.parametrize("mmap_mode", ["r", None])
+def test_save_and_load(db, mmap_mode):
+    with tempfile.NamedTemporaryFile() as temp_file:
+        db.save(temp_file.name)
+        loaded_db = InterwikiDB.load(temp_file.name, mmap_mode=mmap_mode)
+
+        for array in (loaded_db._data, loaded_db._indptr, loaded_db._title_indices):
+            assert isinstance(array, np.ndarray)
+            assert isinstance(array, np.memmap) == (mmap_mode is not None)
+
+        assert loaded_db.query("Spain", "en") == db.query("Spain", "en")
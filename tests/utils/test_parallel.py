@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+
+from luke.utils.parallel import map_chunks, resolve_pool_and_chunk_size
+
+_factor = None
+
+
+def _initialize_worker(factor: int):
+    global _factor
+    _factor = factor
+
+
+def _multiply(value: int) -> int:
+    return value * _factor
+
+
+def test_map_chunks_ordered():
+    ret = list(map_chunks(_multiply, range(20), 2, 3, initializer=_initialize_worker, initargs=(3,)))
+    assert ret == [n * 3 for n in range(20)]
+
+
+def test_map_chunks_unordered():
+    ret = map_chunks(_multiply, range(20), 2, 3, initializer=_initialize_worker, initargs=(5,), ordered=False)
+    assert sorted(ret) == [n * 5 for n in range(20)]
+
+
+def test_map_chunks_shuts_down_workers():
+    list(map_chunks(_multiply, range(20), 2, 3, initializer=_initialize_worker, initargs=(1,)))
+    assert multiprocessing.active_children() == []
+
+    it = map_chunks(_multiply, range(20), 2, 3, initializer=_initialize_worker, initargs=(1,))
+    next(it)
+    it.close()
+    assert multiprocessing.active_children() == []
+
+
+def test_resolve_pool_and_chunk_size():
+    assert resolve_pool_and_chunk_size(1000, 5, None) == (5, 50)
+    assert resolve_pool_and_chunk_size(1000, 5, 7) == (5, 7)
+    assert resolve_pool_and_chunk_size(3, 5, None) == (5, 1)
+    assert resolve_pool_and_chunk_size(100000, 5, None, max_chunk_size=100) == (5, 100)
+    assert resolve_pool_and_chunk_size(100000, 5, 500, max_chunk_size=100) == (5, 500)
+
+
+def test_resolve_pool_and_chunk_size_without_pool_size(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 2)
+    assert resolve_pool_and_chunk_size(80, None, None) == (2, 10)
+
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert resolve_pool_and_chunk_size(80, None, None) == (1, 20)